@@ -679,13 +679,15 @@ async def platform_async_setup_entry(
     entry_data.info[component_key] = {}
     entry_data.old_info[component_key] = {}
     entry_data.state.setdefault(state_type, {})
+    entities: dict[int, _EntityT] = {}
 
     @callback
     def async_list_entities(infos: list[EntityInfo]) -> None:
         """Update entities of this platform when entities are listed."""
         old_infos = entry_data.info[component_key]
         new_infos: dict[int, EntityInfo] = {}
-        add_entities: list[_EntityT] = []
+        new_keys: list[int] = []
+        updated_keys: list[int] = []
         for info in infos:
             if not isinstance(info, info_type):
                 # Filter out infos that don't belong to this platform.
@@ -694,14 +696,15 @@ async def platform_async_setup_entry(
             if info.key in old_infos:
                 # Update existing entity
                 old_infos.pop(info.key)
+                updated_keys.append(info.key)
             else:
                 # Create new entity
-                entity = entity_type(entry_data, component_key, info.key, state_type)
-                add_entities.append(entity)
+                new_keys.append(info.key)
             new_infos[info.key] = info
 
         # Remove old entities
         for info in old_infos.values():
+            entities.pop(info.key, None)
             entry_data.async_remove_entity(hass, component_key, info.key)
 
         # First copy the now-old info into the backup object
@@ -709,6 +712,19 @@ async def platform_async_setup_entry(
         # Then update the actual info
         entry_data.info[component_key] = new_infos
 
+        # Let existing entities update from their new static info
+        for key in updated_keys:
+            if (entity := entities.get(key)) is not None:
+                # pylint: disable-next=protected-access
+                entity._on_static_info_update(new_infos[key])
+
+        # Create the new entities now that their static info is stored
+        add_entities: list[_EntityT] = []
+        for key in new_keys:
+            entity = entity_type(entry_data, component_key, key, state_type)
+            entities[key] = entity
+            add_entities.append(entity)
+
         # Add entities to Home Assistant
         async_add_entities(add_entities)
 
@@ -776,6 +792,7 @@ class EsphomeEntity(Entity, Generic[_InfoT, _StateT]):
         self._state_type = state_type
         if entry_data.device_info is not None and entry_data.device_info.friendly_name:
             self._attr_has_entity_name = True
+        self._on_static_info_update(self._static_info)
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
@@ -801,6 +818,14 @@ class EsphomeEntity(Entity, Generic[_InfoT, _StateT]):
             )
         )
 
+    @callback
+    def _on_static_info_update(self, static_info: _InfoT) -> None:
+        """Derive entity attributes from the static info.
+
+        Called when the entity is created and when the device sends
+        new static info. Behavior can be changed in child classes.
+        """
+
     @callback
     def _on_state_update(self) -> None:
         # Behavior can be changed in child classes
@@ -1,5 +1,6 @@
 """Helper class to convert between Home Assistant and ESPHome enum values."""
 
+from functools import cached_property
 from typing import Generic, TypeVar, overload
 
 from aioesphomeapi import APIIntEnum
@@ -20,8 +21,25 @@ class EsphomeEnumMapper(Generic[_EnumT, _ValT]):
         augmented_mapping[None] = None
 
         self._mapping = augmented_mapping
-        self._inverse: dict[_ValT, _EnumT] = {v: k for k, v in mapping.items()}
-
+        # Look values up with the bound dict method, skipping a Python call
+        lookup = augmented_mapping.__getitem__
+        self.from_esphome = lookup  # type: ignore[assignment,method-assign]
+
+    @cached_property
+    def _inverse(self) -> dict[_ValT, _EnumT]:
+        """Return the hass to esphome mapping, built on first use.
+
+        The None mapping added in __init__ is left out, so it can't replace
+        a real esphome value that maps to None.
+        """
+        return {
+            v: k  # type: ignore[misc]
+            for k, v in self._mapping.items()
+            if k is not None
+        }
+
+    # The signature is kept for typing; instances bind from_esphome in __init__
+    # pylint: disable=method-hidden
     @overload
     def from_esphome(self, value: _EnumT) -> _ValT:
         ...
@@ -34,6 +52,8 @@ class EsphomeEnumMapper(Generic[_EnumT, _ValT]):
         """Convert from an esphome int representation to a hass string."""
         return self._mapping[value]
 
+    # pylint: enable=method-hidden
+
     def from_hass(self, value: _ValT) -> _EnumT:
         """Convert from a hass string to a esphome int representation."""
         return self._inverse[value]
@@ -1,6 +1,8 @@
 """Support for ESPHome media players."""
 from __future__ import annotations
 
+import math
+import time
 from typing import Any
 
 from aioesphomeapi import (
@@ -21,10 +23,10 @@ from homeassistant.components.media_player import (
     async_process_play_media_url,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import EsphomeEntity, esphome_state_property, platform_async_setup_entry
+from . import EsphomeEntity, platform_async_setup_entry
 from .enum_mapper import EsphomeEnumMapper
 
 
@@ -53,6 +55,38 @@ _STATES: EsphomeEnumMapper[EspMediaPlayerState, MediaPlayerState] = EsphomeEnumM
     }
 )
 
+# Seconds the list of media sources is reused for
+_BROWSE_CACHE_TTL = 30
+
+_CMD_PAUSE = MediaPlayerCommand.PAUSE
+_CMD_PLAY = MediaPlayerCommand.PLAY
+_CMD_STOP = MediaPlayerCommand.STOP
+_CMD_MUTE = MediaPlayerCommand.MUTE
+_CMD_UNMUTE = MediaPlayerCommand.UNMUTE
+
+_PLAY_MEDIA_FEATURES = (
+    MediaPlayerEntityFeature.PLAY_MEDIA | MediaPlayerEntityFeature.BROWSE_MEDIA
+)
+_PAUSE_FEATURES = MediaPlayerEntityFeature.PAUSE | MediaPlayerEntityFeature.PLAY
+
+_BASE_FEATURES = (
+    _PLAY_MEDIA_FEATURES
+    | MediaPlayerEntityFeature.STOP
+    | MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_MUTE
+)
+
+# Optional features, keyed by the MediaPlayerInfo flag that enables them
+_FEATURE_MAP: tuple[tuple[str, MediaPlayerEntityFeature], ...] = (
+    ("supports_pause", _PAUSE_FEATURES),
+)
+
+
+def _is_audio(item: BrowseMedia) -> bool:
+    """Return if the media item is audio the player can play."""
+    # Slice compare is cheaper than a startswith method call for a short prefix
+    return item.media_content_type[:6] == "audio/"
+
 
 class EsphomeMediaPlayer(
     EsphomeEntity[MediaPlayerInfo, MediaPlayerEntityState], MediaPlayerEntity
@@ -61,37 +95,45 @@ class EsphomeMediaPlayer(
 
     _attr_device_class = MediaPlayerDeviceClass.SPEAKER
 
-    @property
-    @esphome_state_property
-    def state(self) -> MediaPlayerState | None:
-        """Return current state."""
-        return _STATES.from_esphome(self._state.state)
-
-    @property
-    @esphome_state_property
-    def is_volume_muted(self) -> bool:
-        """Return true if volume is muted."""
-        return self._state.muted
-
-    @property
-    @esphome_state_property
-    def volume_level(self) -> float | None:
-        """Volume level of the media player (0..1)."""
-        return self._state.volume
-
-    @property
-    def supported_features(self) -> MediaPlayerEntityFeature:
-        """Flag supported features."""
-        flags = (
-            MediaPlayerEntityFeature.PLAY_MEDIA
-            | MediaPlayerEntityFeature.BROWSE_MEDIA
-            | MediaPlayerEntityFeature.STOP
-            | MediaPlayerEntityFeature.VOLUME_SET
-            | MediaPlayerEntityFeature.VOLUME_MUTE
-        )
-        if self._static_info.supports_pause:
-            flags |= MediaPlayerEntityFeature.PAUSE | MediaPlayerEntityFeature.PLAY
-        return flags
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self._browse_cache: tuple[float, media_source.BrowseMediaSource] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks and set the current state."""
+        await super().async_added_to_hass()
+        self._update_state_attrs()
+
+    @callback
+    def _on_state_update(self) -> None:
+        """Update the state attributes when the device state changes."""
+        self._update_state_attrs()
+        super()._on_state_update()
+
+    @callback
+    def _update_state_attrs(self) -> None:
+        """Copy the device state into the entity attributes."""
+        if not self._has_state:
+            self._attr_state = None
+            self._attr_is_volume_muted = None
+            self._attr_volume_level = None
+            return
+        state = self._state
+        self._attr_state = _STATES.from_esphome(state.state)
+        self._attr_is_volume_muted = state.muted
+        # Home Assistant doesn't use NAN values in state machine
+        volume = state.volume
+        self._attr_volume_level = None if math.isnan(volume) else volume
+
+    @callback
+    def _on_static_info_update(self, static_info: MediaPlayerInfo) -> None:
+        """Set the supported features from the static info."""
+        flags = _BASE_FEATURES
+        for name, feature in _FEATURE_MAP:
+            if getattr(static_info, name):
+                flags |= feature
+        self._attr_supported_features = flags
 
     async def async_play_media(
         self, media_type: MediaType | str, media_id: str, **kwargs: Any
@@ -106,7 +148,7 @@ class EsphomeMediaPlayer(
         media_id = async_process_play_media_url(self.hass, media_id)
 
         await self._client.media_player_command(
-            self._static_info.key,
+            self._key,
             media_url=media_id,
         )
 
@@ -116,43 +158,57 @@ class EsphomeMediaPlayer(
         media_content_id: str | None = None,
     ) -> BrowseMedia:
         """Implement the websocket media browsing helper."""
+        if media_content_id is not None:
+            return await self._async_browse_media_source(media_content_id)
+
+        now = time.monotonic()
+        if (cached := self._browse_cache) and cached[0] > now:
+            return cached[1]
+
+        result = await self._async_browse_media_source(None)
+        # Only the list of media sources is cached. With a single media source
+        # the root is that source's own listing, which can change at any time.
+        self._browse_cache = (
+            (now + _BROWSE_CACHE_TTL, result) if result.domain is None else None
+        )
+        return result
+
+    async def _async_browse_media_source(
+        self, media_content_id: str | None
+    ) -> media_source.BrowseMediaSource:
+        """Browse the audio content of the media sources."""
         return await media_source.async_browse_media(
             self.hass,
             media_content_id,
-            content_filter=lambda item: item.media_content_type.startswith("audio/"),
+            content_filter=_is_audio,
         )
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         await self._client.media_player_command(
-            self._static_info.key,
+            self._key,
             volume=volume,
         )
 
-    async def async_media_pause(self) -> None:
-        """Send pause command."""
+    async def _async_send_command(self, command: MediaPlayerCommand) -> None:
+        """Send a media player command to the device."""
         await self._client.media_player_command(
-            self._static_info.key,
-            command=MediaPlayerCommand.PAUSE,
+            self._key,
+            command=command,
         )
 
+    async def async_media_pause(self) -> None:
+        """Send pause command."""
+        await self._async_send_command(_CMD_PAUSE)
+
     async def async_media_play(self) -> None:
         """Send play command."""
-        await self._client.media_player_command(
-            self._static_info.key,
-            command=MediaPlayerCommand.PLAY,
-        )
+        await self._async_send_command(_CMD_PLAY)
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        await self._client.media_player_command(
-            self._static_info.key,
-            command=MediaPlayerCommand.STOP,
-        )
+        await self._async_send_command(_CMD_STOP)
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
-        await self._client.media_player_command(
-            self._static_info.key,
-            command=MediaPlayerCommand.MUTE if mute else MediaPlayerCommand.UNMUTE,
-        )
+        await self._async_send_command(_CMD_MUTE if mute else _CMD_UNMUTE)
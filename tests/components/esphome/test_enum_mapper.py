@@ -1,6 +1,7 @@
 """Test ESPHome enum mapper."""
 
 from aioesphomeapi import APIIntEnum
+import pytest
 
 from homeassistant.backports.enum import StrEnum
 from homeassistant.components.esphome.enum_mapper import EsphomeEnumMapper
@@ -35,8 +36,36 @@ async def test_map_esphome_to_ha() -> None:
     assert MOCK_MAPPING.from_esphome(MockEnum.ESPHOME_BAR) == MockStrEnum.HA_BAR
 
 
+async def test_map_esphome_to_ha_none() -> None:
+    """Test mapping None from ESPHome to HA."""
+
+    assert MOCK_MAPPING.from_esphome(None) is None
+
+
+async def test_map_esphome_to_ha_unknown() -> None:
+    """Test mapping an unknown value from ESPHome to HA raises."""
+
+    with pytest.raises(KeyError):
+        MOCK_MAPPING.from_esphome(0)  # type: ignore[arg-type]
+    with pytest.raises(KeyError):
+        MOCK_MAPPING.from_esphome(-1)  # type: ignore[arg-type]
+
+
 async def test_map_ha_to_esphome() -> None:
     """Test mapping from HA to ESPHome."""
 
     assert MOCK_MAPPING.from_hass(MockStrEnum.HA_FOO) == MockEnum.ESPHOME_FOO
     assert MOCK_MAPPING.from_hass(MockStrEnum.HA_BAR) == MockEnum.ESPHOME_BAR
+
+
+async def test_map_ha_none_to_esphome() -> None:
+    """Test an esphome value mapped to None maps back from None."""
+    mapping: EsphomeEnumMapper[MockEnum, MockStrEnum | None] = EsphomeEnumMapper(
+        {
+            MockEnum.ESPHOME_FOO: None,
+            MockEnum.ESPHOME_BAR: MockStrEnum.HA_BAR,
+        }
+    )
+
+    assert mapping.from_hass(None) == MockEnum.ESPHOME_FOO
+    assert mapping.from_hass(MockStrEnum.HA_BAR) == MockEnum.ESPHOME_BAR
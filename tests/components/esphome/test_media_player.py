@@ -0,0 +1,348 @@
+"""Test ESPHome media players."""
+import math
+from pathlib import Path
+from unittest.mock import patch
+
+from aioesphomeapi import (
+    DeviceInfo,
+    MediaPlayerCommand,
+    MediaPlayerEntityState,
+    MediaPlayerInfo,
+    MediaPlayerState as EspMediaPlayerState,
+)
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.esphome import DomainData
+from homeassistant.components.esphome.entry_data import RuntimeEntryData
+from homeassistant.components.esphome.media_player import _BROWSE_CACHE_TTL
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_CONTENT_ID,
+    ATTR_MEDIA_CONTENT_TYPE,
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
+    SERVICE_PLAY_MEDIA,
+    MediaClass,
+    MediaPlayerEntity,
+    MediaPlayerEntityFeature,
+    MediaPlayerState,
+    MediaType,
+)
+from homeassistant.components.media_source import (
+    DOMAIN as MEDIA_SOURCE_DOMAIN,
+    BrowseMediaSource,
+    generate_media_source_id,
+)
+from homeassistant.config import async_process_ha_core_config
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
+    SERVICE_MEDIA_PAUSE,
+    SERVICE_MEDIA_PLAY,
+    SERVICE_MEDIA_STOP,
+    SERVICE_VOLUME_MUTE,
+    SERVICE_VOLUME_SET,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry
+
+ENTITY_ID = "media_player.my_media_player"
+
+BASE_FEATURES = (
+    MediaPlayerEntityFeature.PLAY_MEDIA
+    | MediaPlayerEntityFeature.BROWSE_MEDIA
+    | MediaPlayerEntityFeature.STOP
+    | MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_MUTE
+)
+
+
+def _media_player_info(supports_pause: bool = False) -> MediaPlayerInfo:
+    """Return the static info of a mocked media player."""
+    return MediaPlayerInfo(
+        object_id="my_media_player",
+        key=1,
+        name="my media player",
+        unique_id="my_media_player",
+        supports_pause=supports_pause,
+    )
+
+
+@pytest.fixture(autouse=True)
+def stub_reconnect():
+    """Stub reconnect."""
+    with patch("homeassistant.components.esphome.ReconnectLogic.start"):
+        yield
+
+
+@pytest.fixture
+async def entry_data(
+    hass: HomeAssistant,
+    mock_client,
+    mock_config_entry: MockConfigEntry,
+    mock_device_info: DeviceInfo,
+) -> RuntimeEntryData:
+    """Set up an ESPHome entry with a connected media player."""
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entry_data = DomainData.get(hass).get_entry_data(mock_config_entry)
+    entry_data.device_info = mock_device_info
+    entry_data.available = True
+    await entry_data.async_update_static_infos(
+        hass, mock_config_entry, [_media_player_info()]
+    )
+    await hass.async_block_till_done()
+
+    return entry_data
+
+
+async def test_media_player_created(
+    hass: HomeAssistant, entry_data: RuntimeEntryData
+) -> None:
+    """Test the media player is created with features from its static info."""
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.attributes[ATTR_SUPPORTED_FEATURES] == BASE_FEATURES
+
+    entry = er.async_get(hass).async_get(ENTITY_ID)
+    assert entry is not None
+    assert entry.supported_features == BASE_FEATURES
+
+
+async def test_media_player_static_info_update(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    entry_data: RuntimeEntryData,
+) -> None:
+    """Test a static info update changes the supported features."""
+    await entry_data.async_update_static_infos(
+        hass, mock_config_entry, [_media_player_info(supports_pause=True)]
+    )
+    entry_data.async_update_state(
+        MediaPlayerEntityState(
+            key=1, state=EspMediaPlayerState.PLAYING, volume=0.5, muted=False
+        )
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.attributes[ATTR_SUPPORTED_FEATURES] == (
+        BASE_FEATURES | MediaPlayerEntityFeature.PAUSE | MediaPlayerEntityFeature.PLAY
+    )
+
+
+async def test_media_player_state_before_update(
+    hass: HomeAssistant, entry_data: RuntimeEntryData
+) -> None:
+    """Test the media player has no state before the device sends one."""
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.state == STATE_UNKNOWN
+    assert ATTR_MEDIA_VOLUME_LEVEL not in state.attributes
+    assert ATTR_MEDIA_VOLUME_MUTED not in state.attributes
+
+
+async def test_media_player_state_update(
+    hass: HomeAssistant, entry_data: RuntimeEntryData
+) -> None:
+    """Test the media player state follows the device state."""
+    entry_data.async_update_state(
+        MediaPlayerEntityState(
+            key=1, state=EspMediaPlayerState.PLAYING, volume=0.5, muted=True
+        )
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.state == MediaPlayerState.PLAYING
+    assert state.attributes[ATTR_MEDIA_VOLUME_LEVEL] == 0.5
+    assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is True
+
+    entry_data.async_update_state(
+        MediaPlayerEntityState(
+            key=1, state=EspMediaPlayerState.PAUSED, volume=math.nan, muted=False
+        )
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.state == MediaPlayerState.PAUSED
+    assert ATTR_MEDIA_VOLUME_LEVEL not in state.attributes
+    assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is False
+
+
+async def test_media_player_state_set_when_added(
+    hass: HomeAssistant,
+    mock_client,
+    mock_config_entry: MockConfigEntry,
+    mock_device_info: DeviceInfo,
+) -> None:
+    """Test a device state received before the entity is added is used."""
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entry_data = DomainData.get(hass).get_entry_data(mock_config_entry)
+    entry_data.device_info = mock_device_info
+    entry_data.available = True
+    entry_data.state[MediaPlayerEntityState] = {
+        1: MediaPlayerEntityState(
+            key=1, state=EspMediaPlayerState.IDLE, volume=0.25, muted=False
+        )
+    }
+    await entry_data.async_update_static_infos(
+        hass, mock_config_entry, [_media_player_info()]
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    assert state.state == MediaPlayerState.IDLE
+    assert state.attributes[ATTR_MEDIA_VOLUME_LEVEL] == 0.25
+    assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is False
+
+
+async def test_media_player_commands(
+    hass: HomeAssistant,
+    mock_client,
+    mock_config_entry: MockConfigEntry,
+    entry_data: RuntimeEntryData,
+) -> None:
+    """Test the media player services send commands to the device."""
+    await entry_data.async_update_static_infos(
+        hass, mock_config_entry, [_media_player_info(supports_pause=True)]
+    )
+    await hass.async_block_till_done()
+
+    for service, command in (
+        (SERVICE_MEDIA_PAUSE, MediaPlayerCommand.PAUSE),
+        (SERVICE_MEDIA_PLAY, MediaPlayerCommand.PLAY),
+        (SERVICE_MEDIA_STOP, MediaPlayerCommand.STOP),
+    ):
+        await hass.services.async_call(
+            MEDIA_PLAYER_DOMAIN, service, {ATTR_ENTITY_ID: ENTITY_ID}, blocking=True
+        )
+        mock_client.media_player_command.assert_called_once_with(1, command=command)
+        mock_client.media_player_command.reset_mock()
+
+    for muted, command in (
+        (True, MediaPlayerCommand.MUTE),
+        (False, MediaPlayerCommand.UNMUTE),
+    ):
+        await hass.services.async_call(
+            MEDIA_PLAYER_DOMAIN,
+            SERVICE_VOLUME_MUTE,
+            {ATTR_ENTITY_ID: ENTITY_ID, ATTR_MEDIA_VOLUME_MUTED: muted},
+            blocking=True,
+        )
+        mock_client.media_player_command.assert_called_once_with(1, command=command)
+        mock_client.media_player_command.reset_mock()
+
+    await hass.services.async_call(
+        MEDIA_PLAYER_DOMAIN,
+        SERVICE_VOLUME_SET,
+        {ATTR_ENTITY_ID: ENTITY_ID, ATTR_MEDIA_VOLUME_LEVEL: 0.5},
+        blocking=True,
+    )
+    mock_client.media_player_command.assert_called_once_with(1, volume=0.5)
+    mock_client.media_player_command.reset_mock()
+
+    await hass.services.async_call(
+        MEDIA_PLAYER_DOMAIN,
+        SERVICE_PLAY_MEDIA,
+        {
+            ATTR_ENTITY_ID: ENTITY_ID,
+            ATTR_MEDIA_CONTENT_TYPE: MediaType.MUSIC,
+            ATTR_MEDIA_CONTENT_ID: "http://www.example.com/song.mp3",
+        },
+        blocking=True,
+    )
+    mock_client.media_player_command.assert_called_once_with(
+        1, media_url="http://www.example.com/song.mp3"
+    )
+
+
+def _browse_result(domain: str | None) -> BrowseMediaSource:
+    """Return a browse result for a media source domain."""
+    return BrowseMediaSource(
+        domain=domain,
+        identifier=None,
+        media_class=MediaClass.APP,
+        media_content_type="",
+        title="Media Sources",
+        can_play=False,
+        can_expand=True,
+    )
+
+
+def _get_media_player(hass: HomeAssistant) -> MediaPlayerEntity:
+    """Return the media player entity."""
+    entity = hass.data[MEDIA_PLAYER_DOMAIN].get_entity(ENTITY_ID)
+    assert entity is not None
+    return entity
+
+
+async def test_browse_media_cached(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    entry_data: RuntimeEntryData,
+) -> None:
+    """Test the list of media sources is cached until it expires."""
+    media_player = _get_media_player(hass)
+
+    with patch(
+        "homeassistant.components.esphome.media_player.media_source.async_browse_media",
+        side_effect=lambda *args, **kwargs: _browse_result(None),
+    ) as mock_browse_media:
+        result = await media_player.async_browse_media()
+        assert await media_player.async_browse_media() is result
+        assert mock_browse_media.call_count == 1
+
+        freezer.tick(_BROWSE_CACHE_TTL + 1)
+        assert await media_player.async_browse_media() is not result
+        assert mock_browse_media.call_count == 2
+
+
+async def test_browse_media_single_source_not_cached(
+    hass: HomeAssistant,
+    entry_data: RuntimeEntryData,
+) -> None:
+    """Test the root is not cached when it lists the only media source."""
+    media_player = _get_media_player(hass)
+
+    with patch(
+        "homeassistant.components.esphome.media_player.media_source.async_browse_media",
+        side_effect=lambda *args, **kwargs: _browse_result(MEDIA_SOURCE_DOMAIN),
+    ) as mock_browse_media:
+        result = await media_player.async_browse_media()
+        assert await media_player.async_browse_media() is not result
+        assert mock_browse_media.call_count == 2
+
+
+async def test_browse_media_local_source(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    entry_data: RuntimeEntryData,
+) -> None:
+    """Test browsing the local media source shows newly added files."""
+    await async_process_ha_core_config(hass, {"media_dirs": {"local": str(tmp_path)}})
+    assert await async_setup_component(hass, MEDIA_SOURCE_DOMAIN, {})
+    await hass.async_block_till_done()
+    media_player = _get_media_player(hass)
+    media_content_id = generate_media_source_id(MEDIA_SOURCE_DOMAIN, "")
+
+    result = await media_player.async_browse_media(media_content_id=media_content_id)
+    assert result.children == []
+
+    (tmp_path / "song.mp3").touch()
+
+    result = await media_player.async_browse_media(media_content_id=media_content_id)
+    assert [child.title for child in result.children] == ["song.mp3"]